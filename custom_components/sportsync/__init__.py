@@ -23,7 +23,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
     # Create coordinator
-    coordinator = SportSyncCoordinator(hass, scan_interval)
+    coordinator = SportSyncCoordinator(hass, scan_interval, entry.options)
 
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
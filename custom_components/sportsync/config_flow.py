@@ -1,6 +1,8 @@
 """Config flow for SportSync integration."""
 from __future__ import annotations
 
+from functools import cache
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -21,11 +23,61 @@ from .const import (
 )
 
 
+_COMMA_SPLIT = re.compile(r"\s*,\s*")
+
+
+# config_flow is preloaded with the integration at startup, so the
+# validators are built on the first form render instead of at import
+@cache
+def _scan_interval_validator() -> vol.All:
+    """Return the scan interval validator shared by both flows."""
+    return vol.All(
+        vol.Coerce(int),
+        vol.Range(min=300, max=86400),
+    )
+
+
+@cache
+def _user_schema() -> vol.Schema:
+    """Return the user step schema, which has no dynamic defaults."""
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_SCAN_INTERVAL,
+                default=DEFAULT_SCAN_INTERVAL,
+            ): _scan_interval_validator(),
+            vol.Optional(CONF_FAVORITE_SPORTS, default=""): str,
+            vol.Optional(CONF_FAVORITE_TEAMS, default=""): str,
+            vol.Optional(CONF_FAVORITE_LEAGUES, default=""): str,
+            vol.Optional(CONF_FAVORITE_TITLES, default=""): str,
+            vol.Optional(CONF_FAVORITE_CHANNELS, default=""): str,
+        }
+    )
+
+
 def parse_comma_list(value: str) -> list[str]:
     """Parse comma-separated string to list."""
     if not value:
         return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for item in _COMMA_SPLIT.split(value.strip()) if item]
+
+
+def _coerce_options(user_input: dict[str, Any]) -> dict[str, Any]:
+    """Convert submitted form values to config entry options."""
+    options: dict[str, Any] = {
+        CONF_SCAN_INTERVAL: user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+    }
+    for key in (
+        CONF_FAVORITE_SPORTS,
+        CONF_FAVORITE_TEAMS,
+        CONF_FAVORITE_LEAGUES,
+        CONF_FAVORITE_TITLES,
+        CONF_FAVORITE_CHANNELS,
+    ):
+        value = user_input.get(key, "")
+        # Values that already arrive as lists need no parsing
+        options[key] = parse_comma_list(value) if isinstance(value, str) else list(value)
+    return options
 
 
 class SportSyncConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -44,46 +96,12 @@ class SportSyncConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(
                 title="SportSync",
                 data={},
-                options={
-                    CONF_SCAN_INTERVAL: user_input.get(
-                        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                    ),
-                    CONF_FAVORITE_SPORTS: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_SPORTS, "")
-                    ),
-                    CONF_FAVORITE_TEAMS: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_TEAMS, "")
-                    ),
-                    CONF_FAVORITE_LEAGUES: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_LEAGUES, "")
-                    ),
-                    CONF_FAVORITE_TITLES: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_TITLES, "")
-                    ),
-                    CONF_FAVORITE_CHANNELS: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_CHANNELS, "")
-                    ),
-                },
+                options=_coerce_options(user_input),
             )
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_SCAN_INTERVAL,
-                        default=DEFAULT_SCAN_INTERVAL,
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=300, max=86400),
-                    ),
-                    vol.Optional(CONF_FAVORITE_SPORTS, default=""): str,
-                    vol.Optional(CONF_FAVORITE_TEAMS, default=""): str,
-                    vol.Optional(CONF_FAVORITE_LEAGUES, default=""): str,
-                    vol.Optional(CONF_FAVORITE_TITLES, default=""): str,
-                    vol.Optional(CONF_FAVORITE_CHANNELS, default=""): str,
-                }
-            ),
+            data_schema=_user_schema(),
             description_placeholders={
                 "default_interval": str(DEFAULT_SCAN_INTERVAL // 60),
             },
@@ -112,26 +130,7 @@ class SportSyncOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(
                 title="",
-                data={
-                    CONF_SCAN_INTERVAL: user_input.get(
-                        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                    ),
-                    CONF_FAVORITE_SPORTS: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_SPORTS, "")
-                    ),
-                    CONF_FAVORITE_TEAMS: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_TEAMS, "")
-                    ),
-                    CONF_FAVORITE_LEAGUES: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_LEAGUES, "")
-                    ),
-                    CONF_FAVORITE_TITLES: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_TITLES, "")
-                    ),
-                    CONF_FAVORITE_CHANNELS: parse_comma_list(
-                        user_input.get(CONF_FAVORITE_CHANNELS, "")
-                    ),
-                },
+                data=_coerce_options(user_input),
             )
 
         # Current values
@@ -151,10 +150,7 @@ class SportSyncOptionsFlow(config_entries.OptionsFlow):
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
                         default=current_interval,
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=300, max=86400),
-                    ),
+                    ): _scan_interval_validator(),
                     vol.Optional(
                         CONF_FAVORITE_SPORTS,
                         default=", ".join(current_sports),
@@ -1,6 +1,9 @@
 """Constants for SportSync integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+import sys
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "sportsync"
@@ -17,7 +20,7 @@ CONF_SCAN_INTERVAL: Final = "scan_interval"
 DEFAULT_SCAN_INTERVAL: Final = 1800  # 30 minutes
 
 # Sport types with metadata
-SPORT_TYPES: Final[dict[str, dict[str, str]]] = {
+_SPORT_TYPES: dict[str, dict[str, str]] = {
     "football": {"name": "Football", "icon": "mdi:soccer", "emoji": "⚽"},
     "hockey": {"name": "Ice Hockey", "icon": "mdi:hockey-puck", "emoji": "🏒"},
     "basketball": {"name": "Basketball", "icon": "mdi:basketball", "emoji": "🏀"},
@@ -57,8 +60,13 @@ SPORT_TYPES: Final[dict[str, dict[str, str]]] = {
     "other": {"name": "Other", "icon": "mdi:trophy", "emoji": "🏆"},
 }
 
+# Read-only view with interned keys
+SPORT_TYPES: Final[Mapping[str, dict[str, str]]] = MappingProxyType(
+    {sys.intern(key): value for key, value in _SPORT_TYPES.items()}
+)
+
 # Sport keyword mappings for auto-detection
-SPORT_KEYWORDS: Final[dict[str, str]] = {
+_SPORT_KEYWORDS: dict[str, str] = {
     # Football - Leagues and competitions
     "fotboll": "football",
     "soccer": "football",
@@ -375,3 +383,9 @@ SPORT_KEYWORDS: Final[dict[str, str]] = {
     "league of legends": "esports",
     "segling": "sailing",
 }
+
+# Read-only view with interned keys and sport ids, so the sport strings
+# stored on events are shared objects that compare by identity first
+SPORT_KEYWORDS: Final[Mapping[str, str]] = MappingProxyType(
+    {sys.intern(key): sys.intern(sport) for key, sport in _SPORT_KEYWORDS.items()}
+)
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 import logging
 from typing import TYPE_CHECKING, Any
@@ -10,8 +12,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
-from .providers import PROVIDERS, SportEvent
+from .const import (
+    DOMAIN,
+    CONF_FAVORITE_SPORTS,
+    CONF_FAVORITE_TEAMS,
+    CONF_FAVORITE_LEAGUES,
+    CONF_FAVORITE_TITLES,
+    CONF_FAVORITE_CHANNELS,
+    DEFAULT_SCAN_INTERVAL,
+)
+from .providers import PROVIDERS, SportEvent, SportProvider
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
@@ -22,53 +32,103 @@ _LOGGER = logging.getLogger(__name__)
 class SportSyncData:
     """Container for SportSync data."""
 
+    __slots__ = (
+        "events",
+        "last_update",
+        "provider_status",
+        "favorites",
+        "_event_dicts",
+        "_starts",
+        "_ends",
+        "_flagged_live",
+        "_live_cache",
+    )
+
     def __init__(self) -> None:
         """Initialize data container."""
         self.events: list[SportEvent] = []
+        # Also the reference time for live/upcoming checks during this update
         self.last_update: datetime | None = None
         self.provider_status: dict[str, dict[str, Any]] = {}
+        # Lowercased favorites from the config entry, keyed by option name
+        self.favorites: dict[str, frozenset[str]] = {}
+        # Parallel to events: serialized dicts and epoch start/end times,
+        # so the time filters compare floats instead of datetimes
+        self._event_dicts: list[dict] = []
+        self._starts: list[float] = []
+        self._ends: list[float | None] = []
+        self._flagged_live: list[int] = []
+        # Live events for the last_update they were computed at, the sensor
+        # reads them for both its state and its attributes
+        self._live_cache: tuple[datetime, list[dict]] | None = None
+
+    def set_events(self, events: list[SportEvent]) -> None:
+        """Store events sorted by start time and serialize each of them once."""
+        events.sort(key=lambda e: e.start_time)
+        self.events = events
+        self._event_dicts = [e.to_dict() for e in events]
+        self._starts = [e.start_time.timestamp() for e in events]
+        self._ends = [e.end_time.timestamp() if e.end_time else None for e in events]
+        self._flagged_live = [i for i, e in enumerate(events) if e.is_live]
+        self._live_cache = None
 
     @property
     def all_events(self) -> list[dict]:
-        """Get all events as dicts, sorted by start time."""
-        sorted_events = sorted(self.events, key=lambda e: e.start_time)
-        return [e.to_dict() for e in sorted_events]
+        """Get all events as dicts, sorted by start time.
 
-    def get_favorites(
-        self,
-        sports: list[str] | None = None,
-        teams: list[str] | None = None,
-        leagues: list[str] | None = None,
-        titles: list[str] | None = None,
-        channels: list[str] | None = None,
-    ) -> list[dict]:
+        The list is shared between callers and must not be modified.
+        """
+        return self._event_dicts
+
+    def get_favorites(self) -> list[dict]:
         """Get favorite events as dicts, sorted by start time."""
-        favorites = [
-            e for e in self.events
-            if e.matches_favorites(sports, teams, leagues, titles, channels)
+        sports = self.favorites.get(CONF_FAVORITE_SPORTS)
+        teams = self.favorites.get(CONF_FAVORITE_TEAMS)
+        leagues = self.favorites.get(CONF_FAVORITE_LEAGUES)
+        titles = self.favorites.get(CONF_FAVORITE_TITLES)
+        channels = self.favorites.get(CONF_FAVORITE_CHANNELS)
+
+        # Nothing can match without favorites, skip the per-event checks
+        if not sports and not teams and not leagues and not titles and not channels:
+            return []
+
+        return [
+            event_dict
+            for e, event_dict in zip(self.events, self._event_dicts)
+            if e.matches_favorites_lowered(sports, teams, leagues, titles, channels)
         ]
-        sorted_favorites = sorted(favorites, key=lambda e: e.start_time)
-        return [e.to_dict() for e in sorted_favorites]
 
     def get_live_events(self) -> list[dict]:
-        """Get currently live events."""
-        now = datetime.now()
+        """Get currently live events.
+
+        The list is shared between callers until the next update and must
+        not be modified.
+        """
+        cache = self._live_cache
+        if cache is not None and cache[0] == self.last_update:
+            return cache[1]
+
+        now_ts = (self.last_update or datetime.now()).timestamp()
+        started = bisect_right(self._starts, now_ts)
+        ends = self._ends
         live = [
-            e for e in self.events
-            if e.is_live or (e.start_time <= now and (e.end_time is None or e.end_time >= now))
+            i for i in range(started)
+            if ends[i] is None or ends[i] >= now_ts or self.events[i].is_live
         ]
-        return [e.to_dict() for e in live]
+        # Events flagged live by the provider count even if they start later
+        live.extend(i for i in self._flagged_live if i >= started)
+        result = [self._event_dicts[i] for i in live]
+        # Without a last_update the reference time is "now", so don't cache
+        if self.last_update is not None:
+            self._live_cache = (self.last_update, result)
+        return result
 
     def get_upcoming_events(self, hours: int = 3) -> list[dict]:
         """Get events starting within the next N hours."""
-        now = datetime.now()
-        cutoff = now + timedelta(hours=hours)
-        upcoming = [
-            e for e in self.events
-            if now <= e.start_time <= cutoff
-        ]
-        sorted_upcoming = sorted(upcoming, key=lambda e: e.start_time)
-        return [e.to_dict() for e in sorted_upcoming]
+        now_ts = (self.last_update or datetime.now()).timestamp()
+        lo = bisect_left(self._starts, now_ts)
+        hi = bisect_right(self._starts, now_ts + hours * 3600)
+        return self._event_dicts[lo:hi]
 
 
 class SportSyncCoordinator(DataUpdateCoordinator[SportSyncData]):
@@ -78,6 +138,7 @@ class SportSyncCoordinator(DataUpdateCoordinator[SportSyncData]):
         self,
         hass: HomeAssistant,
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        options: Mapping[str, Any] | None = None,
     ) -> None:
         """Initialize coordinator."""
         super().__init__(
@@ -86,45 +147,59 @@ class SportSyncCoordinator(DataUpdateCoordinator[SportSyncData]):
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
         )
+        # All providers share Home Assistant's pooled session, which keeps
+        # connections alive between refreshes
         self._session: ClientSession = async_get_clientsession(hass)
         self._providers = [provider(self._session) for provider in PROVIDERS]
 
+        # Favorites only change through the options flow, which reloads the
+        # config entry, so they are lowercased once here
+        options = options or {}
+        self._favorites = SportEvent.lower_favorites(
+            {
+                key: options.get(key, [])
+                for key in (
+                    CONF_FAVORITE_SPORTS,
+                    CONF_FAVORITE_TEAMS,
+                    CONF_FAVORITE_LEAGUES,
+                    CONF_FAVORITE_TITLES,
+                    CONF_FAVORITE_CHANNELS,
+                )
+            }
+        )
+
     async def _async_update_data(self) -> SportSyncData:
         """Fetch data from all providers."""
         data = SportSyncData()
+        data.favorites = self._favorites
 
-        # Fetch from all providers concurrently
+        # Fetch from all providers concurrently. Results are merged in provider
+        # order as soon as every earlier provider has finished, so dedup still
+        # overlaps with slower fetches but its outcome (which copy of a
+        # duplicate is kept, provider_status order) does not depend on timing.
+        # (same time + similar title = duplicate)
+        seen: dict[tuple[int, str], SportEvent] = {}
         tasks = [
-            self._fetch_provider(provider)
-            for provider in self._providers
+            asyncio.ensure_future(self._fetch_provider_result(index, provider))
+            for index, provider in enumerate(self._providers)
         ]
+        finished: dict[int, list[SportEvent] | Exception] = {}
+        next_index = 0
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                index, result = await next_result
+                finished[index] = result
+                while next_index in finished:
+                    self._apply_result(
+                        data, seen, self._providers[next_index], finished.pop(next_index)
+                    )
+                    next_index += 1
+        finally:
+            # On cancellation as_completed leaves the fetches running
+            for task in tasks:
+                task.cancel()
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_events: list[SportEvent] = []
-        for provider, result in zip(self._providers, results):
-            if isinstance(result, Exception):
-                _LOGGER.error(
-                    "Error fetching from %s: %s",
-                    provider.name,
-                    result,
-                )
-                data.provider_status[provider.name] = {
-                    "status": "error",
-                    "error": str(result),
-                    "events_count": 0,
-                }
-            else:
-                events = result or []
-                all_events.extend(events)
-                data.provider_status[provider.name] = {
-                    "status": "ok",
-                    "events_count": len(events),
-                    "last_fetch": provider.last_fetch.isoformat() if provider.last_fetch else None,
-                }
-
-        # Deduplicate events (same time + similar title = duplicate)
-        data.events = self._deduplicate_events(all_events)
+        data.set_events(list(seen.values()))
         data.last_update = datetime.now()
 
         _LOGGER.debug(
@@ -135,6 +210,43 @@ class SportSyncCoordinator(DataUpdateCoordinator[SportSyncData]):
 
         return data
 
+    async def _fetch_provider_result(
+        self, index: int, provider: SportProvider
+    ) -> tuple[int, list[SportEvent] | Exception]:
+        """Fetch a provider and pair its index with its events or the raised error."""
+        try:
+            return index, await self._fetch_provider(provider)
+        except Exception as err:
+            return index, err
+
+    def _apply_result(
+        self,
+        data: SportSyncData,
+        seen: dict[tuple[int, str], SportEvent],
+        provider: SportProvider,
+        result: list[SportEvent] | Exception,
+    ) -> None:
+        """Record a provider's status and merge its events into seen."""
+        if isinstance(result, Exception):
+            _LOGGER.error(
+                "Error fetching from %s: %s",
+                provider.name,
+                result,
+            )
+            data.provider_status[provider.name] = {
+                "status": "error",
+                "error": str(result),
+                "events_count": 0,
+            }
+        else:
+            events = result or []
+            self._merge_events(seen, events)
+            data.provider_status[provider.name] = {
+                "status": "ok",
+                "events_count": len(events),
+                "last_fetch": provider.last_fetch.isoformat() if provider.last_fetch else None,
+            }
+
     async def _fetch_provider(self, provider) -> list[SportEvent]:
         """Fetch events from a single provider."""
         try:
@@ -143,22 +255,18 @@ class SportSyncCoordinator(DataUpdateCoordinator[SportSyncData]):
             _LOGGER.error("Provider %s failed: %s", provider.name, err)
             raise UpdateFailed(f"Provider {provider.name} failed: {err}") from err
 
-    def _deduplicate_events(self, events: list[SportEvent]) -> list[SportEvent]:
-        """Remove duplicate events from different providers."""
-        seen: dict[str, SportEvent] = {}
-
+    def _merge_events(
+        self, seen: dict[tuple[int, str], SportEvent], events: list[SportEvent]
+    ) -> None:
+        """Merge events into seen, skipping duplicates from other providers."""
         for event in events:
-            # Create a key based on start time and normalized title
-            title_normalized = event.title.lower().replace(" ", "")[:30]
-            key = f"{event.start_time.strftime('%Y%m%d%H%M')}_{title_normalized}"
+            # Key is based on start time and normalized title
+            key = event.dedup_key
+            existing = seen.get(key)
 
-            if key not in seen:
+            if existing is None:
                 seen[key] = event
-            else:
+            elif (event.league and not existing.league) or \
+                 (event.home_team and not existing.home_team):
                 # Keep the one with more information
-                existing = seen[key]
-                if (event.league and not existing.league) or \
-                   (event.home_team and not existing.home_team):
-                    seen[key] = event
-
-        return list(seen.values())
+                seen[key] = event
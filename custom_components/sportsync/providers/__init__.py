@@ -1,7 +1,7 @@
 """SportSync providers."""
 from __future__ import annotations
 
-from .base import SportProvider, SportEvent
+from .base import SportProvider, SportEvent, detect_sport
 from .tvsporten import TVSportenProvider
 from .tvmatchen import TVMatchenProvider
 
@@ -14,6 +14,7 @@ PROVIDERS: list[type[SportProvider]] = [
 __all__ = [
     "SportProvider",
     "SportEvent",
+    "detect_sport",
     "TVSportenProvider",
     "TVMatchenProvider",
     "PROVIDERS",
@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache, lru_cache
 import hashlib
 import logging
 import re
+import sys
 from typing import TYPE_CHECKING
 
+from bs4 import BeautifulSoup, FeatureNotFound, NavigableString, SoupStrainer
+
 from ..const import SPORT_KEYWORDS
 
 if TYPE_CHECKING:
@@ -16,8 +21,60 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Separators between team names in titles like "Team A - Team B"
+_SEPARATORS: tuple[str, ...] = (" - ", " – ", " — ", " vs ", " mot ", " v ")
+
+_PAREN_TAIL_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_TEAM_CAMEL_RE = re.compile(
+    r"^([A-ZÅÄÖ][a-zåäöé]+(?:\s+[A-ZÅÄÖ][a-zåäöé.]+)*)([A-ZÅÄÖ][a-zåäöé]+.*)$"
+)
+_TEAM_ABBR_RE = re.compile(
+    r"^((?:[A-Z]{2,4}\s)?[A-ZÅÄÖ][a-zåäöé]+(?:\s+[A-ZÅÄÖ][a-zåäöé.]+)*)"
+    r"((?:[A-Z]{2,4}\s)?[A-ZÅÄÖ][a-zåäöé]+.*)$"
+)
+# Every camelCase split above needs a lowercase letter directly followed by an
+# uppercase one, a single search for that rules out most titles cheaply
+_CAMEL_BOUNDARY_RE = re.compile(r"[a-zåäöé.][A-ZÅÄÖ]")
+_TIME_HHMM_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+@cache
+def _sorted_sport_keywords() -> tuple[tuple[str, str], ...]:
+    """Return lowercased sport keywords sorted by length, longest first.
+
+    Built on first use rather than at import so loading the integration
+    does not pay for it.
+    """
+    return tuple(
+        sorted(
+            ((keyword.lower(), sport) for keyword, sport in SPORT_KEYWORDS.items()),
+            key=lambda x: len(x[0]),
+            reverse=True,
+        )
+    )
+
+
+def detect_sport(text: str) -> str:
+    """Detect sport type from text."""
+    text_lower = text.lower()
+
+    # Keywords are sorted longest first to match specific terms before generic ones
+    # This ensures "skidskytte" matches before "vm", "champions league" before "league" etc.
+    for keyword, sport in _sorted_sport_keywords():
+        if keyword in text_lower:
+            return sport
+    return "other"
+
 
-@dataclass
+# Class names, headers and data attributes repeat across a page and across
+# updates. Container text is nearly always unique, so it bypasses this cache
+@lru_cache(maxsize=1024)
+def _detect_label_sport(text: str) -> str:
+    """Detect sport type from a short, repeating label."""
+    return detect_sport(text)
+
+
+@dataclass(slots=True)
 class SportEvent:
     """A sport broadcast event."""
 
@@ -33,6 +90,37 @@ class SportEvent:
     away_team: str | None = None
     is_live: bool = False
     channel_logo: str | None = None
+    dedup_key: tuple[int, str] = field(init=False, repr=False, compare=False)
+    # Lowercased copies used by matches_favorites, empty when the value is unset
+    _title_lower: str = field(init=False, repr=False, compare=False)
+    _sport_lower: str = field(init=False, repr=False, compare=False)
+    _league_lower: str = field(init=False, repr=False, compare=False)
+    _home_lower: str = field(init=False, repr=False, compare=False)
+    _away_lower: str = field(init=False, repr=False, compare=False)
+    _channel_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute derived values and intern frequently repeated strings."""
+        self.sport = sys.intern(self.sport)
+        self.channel = sys.intern(self.channel)
+        self.source = sys.intern(self.source)
+        if self.league:
+            self.league = sys.intern(self.league)
+
+        self._title_lower = self.title.lower()
+        self._sport_lower = self.sport.lower()
+        self._league_lower = self.league.lower() if self.league else ""
+        self._home_lower = self.home_team.lower() if self.home_team else ""
+        self._away_lower = self.away_team.lower() if self.away_team else ""
+        self._channel_lower = self.channel.lower()
+
+        # Key used to spot the same broadcast across providers: the start
+        # minute as an integer bucket plus the normalized title
+        start = self.start_time
+        self.dedup_key = (
+            start.toordinal() * 1440 + start.hour * 60 + start.minute,
+            self._title_lower.replace(" ", "")[:30],
+        )
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -51,6 +139,16 @@ class SportEvent:
             "source": self.source,
         }
 
+    @staticmethod
+    def lower_favorites(
+        favorites: Mapping[str, Iterable[str]],
+    ) -> dict[str, frozenset[str]]:
+        """Lowercase favorite values once for matches_favorites_lowered."""
+        return {
+            key: frozenset(value.lower() for value in values)
+            for key, values in favorites.items()
+        }
+
     def matches_favorites(
         self,
         sports: list[str] | None = None,
@@ -60,38 +158,52 @@ class SportEvent:
         channels: list[str] | None = None,
     ) -> bool:
         """Check if event matches favorite criteria."""
+        return self.matches_favorites_lowered(
+            [sport.lower() for sport in sports] if sports else None,
+            [team.lower() for team in teams] if teams else None,
+            [league.lower() for league in leagues] if leagues else None,
+            [title.lower() for title in titles] if titles else None,
+            [channel.lower() for channel in channels] if channels else None,
+        )
+
+    def matches_favorites_lowered(
+        self,
+        sports: Collection[str] | None = None,
+        teams: Collection[str] | None = None,
+        leagues: Collection[str] | None = None,
+        titles: Collection[str] | None = None,
+        channels: Collection[str] | None = None,
+    ) -> bool:
+        """Check if event matches favorite criteria that are already lowercased."""
         if not sports and not teams and not leagues and not titles and not channels:
             return False
 
-        title_lower = self.title.lower()
+        title_lower = self._title_lower
 
-        # Match sport (case-insensitive, partial match on sport name or key)
+        # Match sport (partial match on sport name or key)
         if sports:
-            sport_lower = self.sport.lower()
-            for sport in sports:
-                sport_search = sport.lower()
+            sport_lower = self._sport_lower
+            for sport_search in sports:
                 if sport_search in sport_lower or sport_lower in sport_search:
                     return True
                 # Also check if sport keyword appears in title
                 if sport_search in title_lower:
                     return True
 
-        # Match team (case-insensitive, partial match)
+        # Match team (partial match)
         if teams:
-            for team in teams:
-                team_lower = team.lower()
+            for team_lower in teams:
                 if team_lower in title_lower:
                     return True
-                if self.home_team and team_lower in self.home_team.lower():
+                if self._home_lower and team_lower in self._home_lower:
                     return True
-                if self.away_team and team_lower in self.away_team.lower():
+                if self._away_lower and team_lower in self._away_lower:
                     return True
 
         # Match league
         if leagues:
-            for league in leagues:
-                league_lower = league.lower()
-                if self.league and league_lower in self.league.lower():
+            for league_lower in leagues:
+                if self._league_lower and league_lower in self._league_lower:
                     return True
                 # Also check title for league name
                 if league_lower in title_lower:
@@ -100,14 +212,14 @@ class SportEvent:
         # Match title keywords
         if titles:
             for title_keyword in titles:
-                if title_keyword.lower() in title_lower:
+                if title_keyword in title_lower:
                     return True
 
         # Match channel
         if channels:
-            channel_lower = self.channel.lower()
+            channel_lower = self._channel_lower
             for channel in channels:
-                if channel.lower() in channel_lower:
+                if channel in channel_lower:
                     return True
 
         return False
@@ -124,14 +236,22 @@ class SportProvider(ABC):
         self.session = session
         self.last_fetch: datetime | None = None
         self.last_error: str | None = None
+        # Start times and their isoformat() strings already built during the
+        # current fetch, keyed by (date ordinal, hour, minute); many events
+        # share the same slot
+        self._ts_cache: dict[tuple[int, int, int], tuple[datetime, str]] = {}
 
     @abstractmethod
     async def async_fetch_events(self, date: datetime | None = None) -> list[SportEvent]:
         """Fetch events for a date. Override in subclasses."""
         pass
 
-    async def _async_fetch_html(self, url: str) -> str | None:
-        """Fetch HTML from URL."""
+    async def _async_fetch_html(self, url: str) -> tuple[bytes, str | None] | None:
+        """Fetch raw HTML from URL with the charset from its Content-Type.
+
+        Decoding is left to the parser, which must be given the header
+        charset since the bytes alone do not carry it.
+        """
         headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -149,7 +269,7 @@ class SportProvider(ABC):
                 if response.status == 200:
                     self.last_fetch = datetime.now()
                     self.last_error = None
-                    return await response.text()
+                    return await response.read(), response.charset
                 else:
                     self.last_error = f"HTTP {response.status}"
                     _LOGGER.warning("Failed to fetch %s: %s", url, self.last_error)
@@ -159,40 +279,64 @@ class SportProvider(ABC):
             _LOGGER.error("Error fetching %s: %s", url, err)
             return None
 
+    def _make_soup(
+        self,
+        html: str | bytes,
+        parse_only: SoupStrainer | None = None,
+        encoding: str | None = None,
+    ) -> BeautifulSoup:
+        """Parse HTML, preferring the lxml C parser when it is installed.
+
+        encoding is the charset declared for bytes input; without it bs4
+        only has the document itself to go on.
+        """
+        try:
+            return BeautifulSoup(
+                html, "lxml", parse_only=parse_only, from_encoding=encoding
+            )
+        except FeatureNotFound:
+            return BeautifulSoup(
+                html, "html.parser", parse_only=parse_only, from_encoding=encoding
+            )
+
+    def _element_text(self, element) -> str:
+        """Return element text as get_text(separator=" ", strip=True) would."""
+        # A container holding a single plain string needs no descendant walk
+        string = element.string
+        if type(string) is NavigableString:
+            return string.strip()
+        return element.get_text(separator=" ", strip=True)
+
     def _generate_id(self, *parts: str) -> str:
         """Generate unique event ID."""
         content = "|".join(str(p) for p in parts if p)
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+        # 6 bytes gives the same 12 hex characters without truncating a longer digest
+        return hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
 
     def _detect_sport(self, text: str) -> str:
         """Detect sport type from text."""
-        text_lower = text.lower()
-
-        # Sort keywords by length (longest first) to match specific terms before generic ones
-        # This ensures "skidskytte" matches before "vm", "champions league" before "league" etc.
-        sorted_keywords = sorted(SPORT_KEYWORDS.items(), key=lambda x: len(x[0]), reverse=True)
+        return detect_sport(text)
 
-        for keyword, sport in sorted_keywords:
-            if keyword in text_lower:
-                return sport
-        return "other"
+    def _detect_label_sport(self, text: str) -> str:
+        """Detect sport type from a class name, header or attribute value."""
+        return _detect_label_sport(text)
 
     def _extract_teams(self, title: str) -> tuple[str | None, str | None]:
         """Extract team names from title like 'Team A - Team B' or 'TeamATeamB'."""
-        # First try standard separators
-        separators = [" - ", " – ", " — ", " vs ", " mot ", " v "]
-        for sep in separators:
-            if sep in title:
-                parts = title.split(sep, 1)
-                if len(parts) == 2:
-                    home = re.sub(r"\s*\([^)]*\)\s*$", "", parts[0].strip())
-                    away = re.sub(r"\s*\([^)]*\)\s*$", "", parts[1].strip())
-                    return home, away
+        # First try standard separators, the camelCase patterns below are
+        # only needed when none is present
+        found_sep = next((sep for sep in _SEPARATORS if sep in title), None)
+        if found_sep:
+            home, away = title.split(found_sep, 1)
+            return _PAREN_TAIL_RE.sub("", home.strip()), _PAREN_TAIL_RE.sub("", away.strip())
+
+        if not _CAMEL_BOUNDARY_RE.search(title):
+            return None, None
 
         # Try to detect concatenated team names (e.g., "SverigeTjeckien" or "PortoMalmö FF")
         # Look for pattern where lowercase letter is followed by uppercase (camelCase boundary)
         # This handles cases like "SverigeTjeckien", "PortoMalmö FF", etc.
-        match = re.match(r"^([A-ZÅÄÖ][a-zåäöé]+(?:\s+[A-ZÅÄÖ][a-zåäöé.]+)*)([A-ZÅÄÖ][a-zåäöé]+.*)$", title)
+        match = _TEAM_CAMEL_RE.match(title)
         if match:
             home = match.group(1).strip()
             away = match.group(2).strip()
@@ -202,11 +346,7 @@ class SportProvider(ABC):
 
         # Try to find team names using known patterns with abbreviations
         # Handles "FC Something" style teams concatenated
-        match = re.match(
-            r"^((?:[A-Z]{2,4}\s)?[A-ZÅÄÖ][a-zåäöé]+(?:\s+[A-ZÅÄÖ][a-zåäöé.]+)*)"
-            r"((?:[A-Z]{2,4}\s)?[A-ZÅÄÖ][a-zåäöé]+.*)$",
-            title
-        )
+        match = _TEAM_ABBR_RE.match(title)
         if match:
             home = match.group(1).strip()
             away = match.group(2).strip()
@@ -219,8 +359,7 @@ class SportProvider(ABC):
         """Format title to include separator between teams if needed."""
         # If we found teams and title doesn't already have a separator, format it
         if home_team and away_team:
-            separators = [" - ", " – ", " — ", " vs ", " mot ", " v "]
-            has_separator = any(sep in title for sep in separators)
+            has_separator = any(sep in title for sep in _SEPARATORS)
             if not has_separator:
                 # Title is likely concatenated, return formatted version
                 return f"{home_team} - {away_team}"
@@ -234,9 +373,20 @@ class SportProvider(ABC):
         time_str = time_str.replace(".", ":").strip()
 
         # Try HH:MM format
-        match = re.match(r"(\d{1,2}):(\d{2})", time_str)
+        match = _TIME_HHMM_RE.match(time_str)
         if match:
             hour, minute = int(match.group(1)), int(match.group(2))
-            return date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            return self._start_slot(date, hour, minute)[0]
 
         return None
+
+    def _start_slot(
+        self, date: datetime, hour: int, minute: int
+    ) -> tuple[datetime, str]:
+        """Return date at hour:minute and its isoformat(), shared per time slot."""
+        key = (date.toordinal(), hour, minute)
+        slot = self._ts_cache.get(key)
+        if slot is None:
+            start_time = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            slot = self._ts_cache[key] = (start_time, start_time.isoformat())
+        return slot
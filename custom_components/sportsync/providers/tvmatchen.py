@@ -1,16 +1,126 @@
 """TVmatchen.nu provider for SportSync."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import logging
 import re
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
 
 from .base import SportProvider, SportEvent
 
 _LOGGER = logging.getLogger(__name__)
 
+_TIME_RE = re.compile(r"\b(\d{1,2})[.:](\d{2})\b")
+# Leading time and trailing channel info, stripped from titles in one sub()
+_TITLE_CLEAN_RE = re.compile(
+    r"^\s*\d{1,2}[.:]\d{2}\s*|\s*(?:TV4|SVT|Eurosport|Viasat|V Sport|C More|Kanal).*$",
+    re.IGNORECASE,
+)
+_TITLE_BREAK_RE = re.compile(r"^(.{20,80}?)(?:\s*[-–|,]|\s{2,})")
+
+# CSS selectors, compiled once instead of on every select() call
+_SECTION_SEL = sv.compile(
+    ".sport-section, .category, .sport-category, "
+    "[class*='sport'], section"
+)
+_CONTAINER_SEL = sv.compile(
+    ".match, .event, .game, .broadcast, "
+    ".listing-item, .schedule-item, "
+    "tr, li.match-item, article"
+)
+_TABLE_SEL = sv.compile("table")
+_ROW_SEL = sv.compile("tr")
+_CELL_SEL = sv.compile("td")
+_HEADER_SEL = sv.compile("h1, h2, h3, h4, .section-title, .sport-title, .category-title")
+_SECTION_ITEM_SEL = sv.compile(
+    ".match, .event, .game, .item, li, tr, "
+    "[class*='match'], [class*='event']"
+)
+_SPORT_ELEM_SEL = sv.compile(
+    ".sport, .category, .sport-type, "
+    "[class*='sport-'], [class*='category-']"
+)
+_TEAMS_SEL = sv.compile(
+    ".teams, .match-teams, .home-away, "
+    "[class*='team'], [class*='match']"
+)
+_HOME_SEL = sv.compile(".home, .home-team, .team-home, .team1")
+_AWAY_SEL = sv.compile(".away, .away-team, .team-away, .team2")
+_TITLE_SEL = sv.compile(
+    ".title, .event-title, .match-title, "
+    "h3, h4, .name, strong"
+)
+_CHANNEL_SEL = sv.compile(
+    ".channel, .tv-channel, .broadcaster, "
+    "td.channel, .kanal, [class*='channel']"
+)
+_LEAGUE_SEL = sv.compile(
+    ".league, .competition, .tournament, "
+    "[class*='league'], [class*='competition']"
+)
+
+# Common channels, more specific names first
+_CHANNELS: tuple[str, ...] = (
+    "TV4 Sport", "TV4+", "TV4",
+    "SVT1", "SVT2", "SVT",
+    "Eurosport 1", "Eurosport 2", "Eurosport",
+    "Viasat Sport", "Viasat Hockey", "Viasat Fotboll", "Viasat",
+    "V Sport Premium", "V Sport 1", "V Sport 2", "V Sport",
+    "C More Live", "C More Fotboll", "C More Hockey", "C More",
+    "Kanal 5", "Kanal 9", "TV3", "TV6",
+    "Discovery+", "Max",
+)
+_CHANNELS_LOWER: tuple[tuple[str, str], ...] = tuple(
+    (channel.lower(), channel) for channel in _CHANNELS
+)
+
+# Specific league patterns, lowercased
+_LEAGUE_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("champions league", "Champions League"),
+    ("europa league", "Europa League"),
+    ("conference league", "Conference League"),
+    ("premier league", "Premier League"),
+    ("premier padel", "Premier Padel Tour"),
+    ("la liga", "La Liga"),
+    ("serie a", "Serie A"),
+    ("bundesliga", "Bundesliga"),
+    ("ligue 1", "Ligue 1"),
+    ("eredivisie", "Eredivisie"),
+    ("allsvenskan", "Allsvenskan"),
+    ("superettan", "Superettan"),
+    ("hockeyallsvenskan", "Hockeyallsvenskan"),
+    ("shl", "SHL"),
+    ("nhl", "NHL"),
+    ("nba", "NBA"),
+    ("nfl", "NFL"),
+    ("mlb", "MLB"),
+    ("atp", "ATP"),
+    ("wta", "WTA"),
+    ("world cup", "World Cup"),
+    ("världscupen", "Världscupen"),
+    ("shoot out", "Shoot Out"),
+    # Sport-specific VM/EM
+    ("handboll-vm", "Handbolls-VM"),
+    ("handbolls-vm", "Handbolls-VM"),
+    ("handboll-em", "Handbolls-EM"),
+    ("handbolls-em", "Handbolls-EM"),
+    ("fotbolls-vm", "Fotbolls-VM"),
+    ("fotbolls-em", "Fotbolls-EM"),
+    ("ishockey-vm", "Ishockey-VM"),
+    ("hockey-vm", "Hockey-VM"),
+    ("dart-vm", "Dart-VM"),
+)
+# Matched longest pattern first, so that e.g. "hockeyallsvenskan" is not
+# reported as "Allsvenskan"
+_SPECIFIC_LEAGUES: tuple[tuple[str, str], ...] = tuple(
+    sorted(_LEAGUE_PATTERNS, key=lambda league: len(league[0]), reverse=True)
+)
+
+# Generic terms that are too often misdetected to use as league names
+_GENERIC_LEAGUE_TERMS: frozenset[str] = frozenset({"os", "vm", "em"})
+
 
 class TVMatchenProvider(SportProvider):
     """Provider for tvmatchen.nu."""
@@ -25,28 +135,32 @@ class TVMatchenProvider(SportProvider):
 
         # TVmatchen.nu structure - base URL for today
         url = self.base_url
+        self._ts_cache.clear()
 
-        html = await self._async_fetch_html(url)
+        fetched = await self._async_fetch_html(url)
+        if fetched is None:
+            return []
+        html, encoding = fetched
         if not html:
             return []
 
-        return self._parse_html(html, date)
+        # Parse in a worker thread so the event loop is not blocked
+        return await asyncio.to_thread(self._parse_html, html, date, encoding)
 
-    def _parse_html(self, html: str, date: datetime) -> list[SportEvent]:
+    def _parse_html(
+        self, html: str | bytes, date: datetime, encoding: str | None = None
+    ) -> list[SportEvent]:
         """Parse TVmatchen.nu HTML structure."""
         events: list[SportEvent] = []
 
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._make_soup(html, encoding=encoding)
 
             # TVmatchen.nu typical structure:
             # Usually organized by sport category with match listings
 
             # Strategy 1: Find sport sections and their matches
-            sport_sections = soup.select(
-                ".sport-section, .category, .sport-category, "
-                "[class*='sport'], section"
-            )
+            sport_sections = _SECTION_SEL.select(soup)
 
             if sport_sections:
                 for section in sport_sections:
@@ -56,11 +170,7 @@ class TVMatchenProvider(SportProvider):
 
             # Strategy 2: If no sections found, look for individual events
             if not events:
-                event_containers = soup.select(
-                    ".match, .event, .game, .broadcast, "
-                    ".listing-item, .schedule-item, "
-                    "tr, li.match-item, article"
-                )
+                event_containers = _CONTAINER_SEL.select(soup)
 
                 for container in event_containers:
                     event = self._parse_event_container(container, date)
@@ -69,9 +179,9 @@ class TVMatchenProvider(SportProvider):
 
             # Strategy 3: Table-based layout
             if not events:
-                tables = soup.select("table")
+                tables = _TABLE_SEL.select(soup)
                 for table in tables:
-                    rows = table.select("tr")
+                    rows = _ROW_SEL.select(table)
                     for row in rows:
                         event = self._parse_table_row(row, date)
                         if event:
@@ -88,10 +198,10 @@ class TVMatchenProvider(SportProvider):
     def _get_section_sport(self, section) -> str | None:
         """Get sport type from section header."""
         # Look for section header
-        header = section.select_one("h1, h2, h3, h4, .section-title, .sport-title, .category-title")
+        header = _HEADER_SEL.select_one(section)
         if header:
             header_text = header.get_text(strip=True)
-            detected = self._detect_sport(header_text)
+            detected = self._detect_label_sport(header_text)
             if detected != "other":
                 return detected
 
@@ -99,14 +209,15 @@ class TVMatchenProvider(SportProvider):
         classes = section.get("class", [])
         if classes:
             class_str = " ".join(classes)
-            detected = self._detect_sport(class_str)
+            detected = self._detect_label_sport(class_str)
             if detected != "other":
                 return detected
 
         # Check data attributes
-        for attr in ["data-sport", "data-category", "data-type"]:
-            if section.get(attr):
-                detected = self._detect_sport(section.get(attr))
+        for attr in ("data-sport", "data-category", "data-type"):
+            value = section.get(attr)
+            if value:
+                detected = self._detect_label_sport(value)
                 if detected != "other":
                     return detected
 
@@ -119,10 +230,7 @@ class TVMatchenProvider(SportProvider):
         events = []
 
         # Find match/event items within section
-        items = section.select(
-            ".match, .event, .game, .item, li, tr, "
-            "[class*='match'], [class*='event']"
-        )
+        items = _SECTION_ITEM_SEL.select(section)
 
         for item in items:
             event = self._parse_event_container(item, date, sport_hint)
@@ -136,14 +244,17 @@ class TVMatchenProvider(SportProvider):
     ) -> SportEvent | None:
         """Parse a single event container."""
         try:
-            text = container.get_text(separator=" ", strip=True)
+            text = self._element_text(container)
 
             # Must have reasonable content
             if len(text) < 10:
                 return None
 
+            # Lowercased once and shared by the extractors below
+            text_lower = text.lower()
+
             # Extract time
-            time_match = re.search(r"\b(\d{1,2})[.:](\d{2})\b", text)
+            time_match = _TIME_RE.search(text)
             if not time_match:
                 return None
 
@@ -151,7 +262,7 @@ class TVMatchenProvider(SportProvider):
             if not (0 <= hour <= 23 and 0 <= minute <= 59):
                 return None
 
-            start_time = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            start_time, start_iso = self._start_slot(date, hour, minute)
 
             # Extract teams/title
             title = self._extract_match_title(container, text)
@@ -159,7 +270,7 @@ class TVMatchenProvider(SportProvider):
                 return None
 
             # Extract channel
-            channel = self._extract_channel(container, text)
+            channel = self._extract_channel(container, text_lower)
 
             # Extract teams
             home_team, away_team = self._extract_teams(title)
@@ -171,14 +282,14 @@ class TVMatchenProvider(SportProvider):
             sport = sport_hint or self._get_element_sport(container) or self._detect_sport(text)
 
             # Extract league
-            league = self._extract_league(container, text)
+            league = self._extract_league(container, text_lower)
 
             # Check if live
-            is_live = "live" in text.lower() or "pågår" in text.lower()
+            is_live = "live" in text_lower or "pågår" in text_lower
 
             event_id = self._generate_id(
                 self.name,
-                start_time.isoformat(),
+                start_iso,
                 title,
                 channel or "",
             )
@@ -206,22 +317,20 @@ class TVMatchenProvider(SportProvider):
         classes = element.get("class", [])
         if classes:
             class_str = " ".join(classes)
-            detected = self._detect_sport(class_str)
+            detected = self._detect_label_sport(class_str)
             if detected != "other":
                 return detected
 
         # Check data attributes
-        for attr in ["data-sport", "data-category", "data-type"]:
-            if element.get(attr):
-                detected = self._detect_sport(element.get(attr))
+        for attr in ("data-sport", "data-category", "data-type"):
+            value = element.get(attr)
+            if value:
+                detected = self._detect_label_sport(value)
                 if detected != "other":
                     return detected
 
         # Check for sport-specific child element
-        sport_elem = element.select_one(
-            ".sport, .category, .sport-type, "
-            "[class*='sport-'], [class*='category-']"
-        )
+        sport_elem = _SPORT_ELEM_SEL.select_one(element)
         if sport_elem:
             detected = self._detect_sport(sport_elem.get_text(strip=True))
             if detected != "other":
@@ -231,57 +340,42 @@ class TVMatchenProvider(SportProvider):
 
     def _parse_table_row(self, row, date: datetime) -> SportEvent | None:
         """Parse a table row as an event."""
-        cells = row.select("td")
+        cells = _CELL_SEL.select(row)
         if len(cells) < 2:
             return None
 
-        text = row.get_text(separator=" ", strip=True)
         return self._parse_event_container(row, date)
 
     def _extract_match_title(self, container, text: str) -> str | None:
         """Extract match title (teams)."""
         # Look for team containers
-        teams_elem = container.select_one(
-            ".teams, .match-teams, .home-away, "
-            "[class*='team'], [class*='match']"
-        )
+        teams_elem = _TEAMS_SEL.select_one(container)
         if teams_elem:
             title = teams_elem.get_text(separator=" - ", strip=True)
             if len(title) > 3:
                 return title
 
         # Look for individual team elements
-        home = container.select_one(".home, .home-team, .team-home, .team1")
-        away = container.select_one(".away, .away-team, .team-away, .team2")
+        home = _HOME_SEL.select_one(container)
+        away = _AWAY_SEL.select_one(container)
         if home and away:
             return f"{home.get_text(strip=True)} - {away.get_text(strip=True)}"
 
         # Look for title element
-        title_elem = container.select_one(
-            ".title, .event-title, .match-title, "
-            "h3, h4, .name, strong"
-        )
+        title_elem = _TITLE_SEL.select_one(container)
         if title_elem:
             title = title_elem.get_text(strip=True)
             if len(title) > 3:
                 return title
 
-        # Extract from full text
-        # Remove time
-        title = re.sub(r"^\s*\d{1,2}[.:]\d{2}\s*", "", text)
-        # Remove channel info at end
-        title = re.sub(
-            r"\s*(TV4|SVT|Eurosport|Viasat|V Sport|C More|Kanal).*$",
-            "",
-            title,
-            flags=re.IGNORECASE,
-        )
+        # Extract from full text, dropping the time and trailing channel info
+        title = _TITLE_CLEAN_RE.sub("", text)
 
         # Clean and truncate
         title = " ".join(title.split())
         if len(title) > 80:
             # Find natural break point
-            match = re.match(r"^(.{20,80}?)(?:\s*[-–|,]|\s{2,})", title)
+            match = _TITLE_BREAK_RE.match(title)
             if match:
                 title = match.group(1)
             else:
@@ -289,89 +383,31 @@ class TVMatchenProvider(SportProvider):
 
         return title.strip() if title.strip() else None
 
-    def _extract_channel(self, container, text: str) -> str | None:
+    def _extract_channel(self, container, text_lower: str) -> str | None:
         """Extract TV channel."""
         # Channel element
-        channel_elem = container.select_one(
-            ".channel, .tv-channel, .broadcaster, "
-            "td.channel, .kanal, [class*='channel']"
-        )
+        channel_elem = _CHANNEL_SEL.select_one(container)
         if channel_elem:
             channel_text = channel_elem.get_text(strip=True)
             if channel_text:
                 return channel_text
 
-        # Common channels
-        channels = [
-            "TV4 Sport", "TV4+", "TV4",
-            "SVT1", "SVT2", "SVT",
-            "Eurosport 1", "Eurosport 2", "Eurosport",
-            "Viasat Sport", "Viasat Hockey", "Viasat Fotboll", "Viasat",
-            "V Sport Premium", "V Sport 1", "V Sport 2", "V Sport",
-            "C More Live", "C More Fotboll", "C More Hockey", "C More",
-            "Kanal 5", "Kanal 9", "TV3", "TV6",
-            "Discovery+", "Max",
-        ]
-
-        text_lower = text.lower()
-        for channel in channels:
-            if channel.lower() in text_lower:
+        for channel_lower, channel in _CHANNELS_LOWER:
+            if channel_lower in text_lower:
                 return channel
 
         return None
 
-    def _extract_league(self, container, text: str) -> str | None:
+    def _extract_league(self, container, text_lower: str) -> str | None:
         """Extract league/competition."""
-        league_elem = container.select_one(
-            ".league, .competition, .tournament, "
-            "[class*='league'], [class*='competition']"
-        )
+        league_elem = _LEAGUE_SEL.select_one(container)
         if league_elem:
             league_text = league_elem.get_text(strip=True)
             # Don't return generic terms that might be misdetected
-            if league_text and league_text.lower() not in ["os", "vm", "em"]:
+            if league_text and league_text.lower() not in _GENERIC_LEAGUE_TERMS:
                 return league_text
 
-        text_lower = text.lower()
-
-        # Specific league patterns (longer/more specific first)
-        specific_leagues = [
-            ("champions league", "Champions League"),
-            ("europa league", "Europa League"),
-            ("conference league", "Conference League"),
-            ("premier league", "Premier League"),
-            ("premier padel", "Premier Padel Tour"),
-            ("la liga", "La Liga"),
-            ("serie a", "Serie A"),
-            ("bundesliga", "Bundesliga"),
-            ("ligue 1", "Ligue 1"),
-            ("eredivisie", "Eredivisie"),
-            ("allsvenskan", "Allsvenskan"),
-            ("superettan", "Superettan"),
-            ("hockeyallsvenskan", "Hockeyallsvenskan"),
-            ("shl", "SHL"),
-            ("nhl", "NHL"),
-            ("nba", "NBA"),
-            ("nfl", "NFL"),
-            ("mlb", "MLB"),
-            ("atp", "ATP"),
-            ("wta", "WTA"),
-            ("world cup", "World Cup"),
-            ("världscupen", "Världscupen"),
-            ("shoot out", "Shoot Out"),
-            # Sport-specific VM/EM
-            ("handboll-vm", "Handbolls-VM"),
-            ("handbolls-vm", "Handbolls-VM"),
-            ("handboll-em", "Handbolls-EM"),
-            ("handbolls-em", "Handbolls-EM"),
-            ("fotbolls-vm", "Fotbolls-VM"),
-            ("fotbolls-em", "Fotbolls-EM"),
-            ("ishockey-vm", "Ishockey-VM"),
-            ("hockey-vm", "Hockey-VM"),
-            ("dart-vm", "Dart-VM"),
-        ]
-
-        for pattern, name in specific_leagues:
+        for pattern, name in _SPECIFIC_LEAGUES:
             if pattern in text_lower:
                 return name
 
@@ -1,16 +1,153 @@
 """TVsporten.nu provider for SportSync."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import logging
 import re
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 
 from .base import SportProvider, SportEvent
 
 _LOGGER = logging.getLogger(__name__)
 
+_TIME_RE = re.compile(r"\b(\d{1,2})[.:](\d{2})\b")
+_TIME_PREFIX_RE = re.compile(r"^\s*\d{1,2}[.:]\d{2}\s*")
+_CHANNEL_TAIL_RE = re.compile(
+    r"\s*(TV4|SVT\d?|Eurosport\s*\d?|Viasat|V Sport|C More|Kanal \d+).*$",
+    re.IGNORECASE,
+)
+
+# Skip the document head and top-level scripts/styles while building the tree.
+# A strainer is only checked until a tag matches and keeps that tag's whole
+# subtree, so everything inside <body> that could hold events is still parsed.
+_PAGE_STRAINER = SoupStrainer(
+    re.compile(
+        r"^(?!(?:html|head|body|title|meta|link|base|script|style|noscript|template)$)"
+    )
+)
+
+# CSS selectors, compiled once instead of on every select() call
+_SECTION_SEL = sv.compile(
+    "[class*='sport'], [class*='category'], "
+    "section, .sport-section, .category-section"
+)
+_SECTION_EVENT_SEL = sv.compile(
+    ".event, .match, .broadcast, tr, li, "
+    "[class*='event'], [class*='match']"
+)
+_SPORT_ELEM_SEL = sv.compile(
+    ".sport, .category, .sport-type, "
+    "[class*='sport-'], [class*='category-']"
+)
+_CHANNEL_SEL = sv.compile(
+    ".channel, .tv-channel, .broadcaster, .kanal, "
+    "[class*='channel'], [class*='kanal']"
+)
+_TITLE_SEL = sv.compile(
+    ".title, .event-title, .match-title, .teams, "
+    "h2, h3, h4, .name, [class*='title'], [class*='match']"
+)
+_LEAGUE_SEL = sv.compile(
+    ".league, .competition, .tournament, .liga, "
+    "[class*='league'], [class*='competition']"
+)
+_LIVE_SEL = sv.compile(".live, .is-live, [class*='live']")
+
+# Common Swedish sport channels
+_CHANNEL_NAMES: tuple[str, ...] = (
+    "TV4", "TV4+", "TV4 Sport", "TV4 Fakta",
+    "SVT1", "SVT2", "SVT24", "SVT",
+    "Kanal 5", "Kanal 9", "Kanal 11",
+    "Eurosport 1", "Eurosport 2", "Eurosport",
+    "Viasat Sport", "Viasat Hockey", "Viasat Fotboll",
+    "Viasat Golf", "Viasat Motor", "Viasat",
+    "V Sport 1", "V Sport 2", "V Sport Premium", "V Sport",
+    "C More Live", "C More Fotboll", "C More Hockey", "C More Sport", "C More",
+    "Sportkanalen",
+    "Telia", "TV3", "TV3+", "TV6", "TV8", "TV10",
+    "Discovery+", "Discovery", "Max",
+    "Dplay", "Viafree", "TV4 Play", "SVT Play",
+)
+# Matched longest name first, so that e.g. "TV4 Sport" is not reported as "TV4"
+_CHANNELS_LOWER: tuple[tuple[str, str], ...] = tuple(
+    (channel.lower(), channel)
+    for channel in sorted(_CHANNEL_NAMES, key=len, reverse=True)
+)
+
+# Specific league patterns, lowercased
+_LEAGUE_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("champions league", "Champions League"),
+    ("europa league", "Europa League"),
+    ("conference league", "Conference League"),
+    ("premier league", "Premier League"),
+    ("premier padel", "Premier Padel Tour"),
+    ("la liga", "La Liga"),
+    ("serie a", "Serie A"),
+    ("bundesliga", "Bundesliga"),
+    ("ligue 1", "Ligue 1"),
+    ("eredivisie", "Eredivisie"),
+    ("allsvenskan", "Allsvenskan"),
+    ("superettan", "Superettan"),
+    ("hockeyallsvenskan", "Hockeyallsvenskan"),
+    ("shl", "SHL"),
+    ("nhl", "NHL"),
+    ("nba", "NBA"),
+    ("nfl", "NFL"),
+    ("mlb", "MLB"),
+    ("atp", "ATP"),
+    ("wta", "WTA"),
+    ("world cup", "World Cup"),
+    ("världscupen", "Världscupen"),
+    ("shoot out", "Shoot Out"),
+    # Sport-specific VM/EM (only match when sport context is clear)
+    ("handboll-vm", "Handbolls-VM"),
+    ("handbolls-vm", "Handbolls-VM"),
+    ("handboll-em", "Handbolls-EM"),
+    ("handbolls-em", "Handbolls-EM"),
+    ("fotbolls-vm", "Fotbolls-VM"),
+    ("fotbolls-em", "Fotbolls-EM"),
+    ("ishockey-vm", "Ishockey-VM"),
+    ("hockey-vm", "Hockey-VM"),
+    ("dart-vm", "Dart-VM"),
+)
+# Matched longest pattern first, so that e.g. "hockeyallsvenskan" is not
+# reported as "Allsvenskan"
+_SPECIFIC_LEAGUES: tuple[tuple[str, str], ...] = tuple(
+    sorted(_LEAGUE_PATTERNS, key=lambda league: len(league[0]), reverse=True)
+)
+
+# Generic terms that are too often misdetected to use as league names
+_GENERIC_LEAGUE_TERMS: frozenset[str] = frozenset({"os", "vm", "em"})
+
+_LIVE_INDICATORS: tuple[str, ...] = ("live", "direktsändning", "pågår", "nu")
+
+# Plain tag/class lookups, matched with find()/find_all() predicates instead
+# of going through CSS selector matching
+_HEADER_TAGS = frozenset({"h1", "h2", "h3", "h4"})
+_HEADER_CLASSES = frozenset({"section-title", "sport-title", "category-title"})
+_EVENT_CLASSES = frozenset({
+    "event", "match", "broadcast", "schedule-item", "tv-event",
+    "sport-event", "listing-item", "event-card",
+})
+
+
+def _is_section_header(tag) -> bool:
+    """Match h1-h4 and section title elements."""
+    return tag.name in _HEADER_TAGS or not _HEADER_CLASSES.isdisjoint(tag.get("class", ()))
+
+
+def _is_event_element(tag) -> bool:
+    """Match elements of a flat event listing."""
+    classes = tag.get("class", ())
+    return (
+        tag.name == "article"
+        or not _EVENT_CLASSES.isdisjoint(classes)
+        or (tag.name == "tr" and "event-row" in classes)
+    )
+
 
 class TVSportenProvider(SportProvider):
     """Provider for tvsporten.nu."""
@@ -25,36 +162,37 @@ class TVSportenProvider(SportProvider):
 
         # TVsporten.nu uses the base URL for today
         url = self.base_url
+        self._ts_cache.clear()
 
-        html = await self._async_fetch_html(url)
+        fetched = await self._async_fetch_html(url)
+        if fetched is None:
+            return []
+        html, encoding = fetched
         if not html:
             return []
 
-        return self._parse_html(html, date)
+        # Parse in a worker thread so the event loop is not blocked
+        return await asyncio.to_thread(self._parse_html, html, date, encoding)
 
-    def _parse_html(self, html: str, date: datetime) -> list[SportEvent]:
+    def _parse_html(
+        self, html: str | bytes, date: datetime, encoding: str | None = None
+    ) -> list[SportEvent]:
         """Parse TVsporten.nu HTML structure."""
         events: list[SportEvent] = []
 
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._make_soup(html, _PAGE_STRAINER, encoding=encoding)
 
             # Strategy 1: Find sport sections with headers
             # Most sport TV guides organize by sport category
-            sport_sections = soup.select(
-                "[class*='sport'], [class*='category'], "
-                "section, .sport-section, .category-section"
-            )
+            sport_sections = _SECTION_SEL.select(soup)
 
             for section in sport_sections:
                 # Get sport from section header or class
                 section_sport = self._get_section_sport(section)
 
                 # Find events within this section
-                section_events = section.select(
-                    ".event, .match, .broadcast, tr, li, "
-                    "[class*='event'], [class*='match']"
-                )
+                section_events = _SECTION_EVENT_SEL.select(section)
 
                 for container in section_events:
                     event = self._parse_event_container(container, date, section_sport)
@@ -63,17 +201,13 @@ class TVSportenProvider(SportProvider):
 
             # Strategy 2: If no sections found, try flat event list
             if not events:
-                event_containers = soup.select(
-                    ".event, .match, .broadcast, .schedule-item, "
-                    ".tv-event, .sport-event, article, .listing-item, "
-                    "tr.event-row, .event-card"
-                )
+                candidates = [(elem, None) for elem in soup.find_all(_is_event_element)]
 
-                if not event_containers:
-                    event_containers = self._find_event_elements(soup)
+                if not candidates:
+                    candidates = self._find_event_elements(soup)
 
-                for container in event_containers:
-                    event = self._parse_event_container(container, date, None)
+                for container, text in candidates:
+                    event = self._parse_event_container(container, date, None, text)
                     if event:
                         events.append(event)
 
@@ -88,10 +222,10 @@ class TVSportenProvider(SportProvider):
     def _get_section_sport(self, section) -> str | None:
         """Extract sport type from a section element."""
         # Check section header (h1, h2, h3, etc.)
-        header = section.select_one("h1, h2, h3, h4, .section-title, .sport-title, .category-title")
+        header = section.find(_is_section_header)
         if header:
             header_text = header.get_text(strip=True)
-            detected = self._detect_sport(header_text)
+            detected = self._detect_label_sport(header_text)
             if detected != "other":
                 return detected
 
@@ -99,45 +233,64 @@ class TVSportenProvider(SportProvider):
         classes = section.get("class", [])
         if classes:
             class_str = " ".join(classes)
-            detected = self._detect_sport(class_str)
+            detected = self._detect_label_sport(class_str)
             if detected != "other":
                 return detected
 
         # Check data attributes
         for attr in ["data-sport", "data-category", "data-type"]:
             if section.get(attr):
-                detected = self._detect_sport(section.get(attr))
+                detected = self._detect_label_sport(section.get(attr))
                 if detected != "other":
                     return detected
 
         return None
 
-    def _find_event_elements(self, soup: BeautifulSoup) -> list:
-        """Find elements that look like event listings."""
+    def _find_event_elements(self, soup: BeautifulSoup) -> list[tuple]:
+        """Find elements that look like event listings.
+
+        Returns (element, text) pairs, where text is the element's stripped
+        text as _parse_event_container would compute it, so the subtree does
+        not have to be walked a second time.
+        """
         elements = []
+        # ids of every node below an accepted element, used to skip nested
+        # duplicates without walking the accepted subtrees again
+        nested_ids: set[int] = set()
 
         # Look for elements containing time patterns (HH:MM or HH.MM)
-        time_pattern = re.compile(r"\b\d{1,2}[.:]\d{2}\b")
-
         for elem in soup.find_all(["div", "tr", "li", "article"]):
-            text = elem.get_text()
+            # Avoid nested duplicates, checked before collecting any text
+            if id(elem) in nested_ids:
+                continue
+            strings = list(elem.strings)
+            text = "".join(strings)
             # Must have a time and reasonable length
-            if time_pattern.search(text) and 20 < len(text) < 500:
-                # Avoid nested duplicates
-                if not any(elem in e.descendants for e in elements):
-                    elements.append(elem)
+            if _TIME_RE.search(text) and 20 < len(text) < 500:
+                nested_ids.update(map(id, elem.descendants))
+                stripped = (string.strip() for string in strings)
+                elements.append((elem, " ".join(part for part in stripped if part)))
+                if len(elements) == 100:  # Limit to prevent runaway
+                    break
 
-        return elements[:100]  # Limit to prevent runaway
+        return elements
 
     def _parse_event_container(
-        self, container, date: datetime, section_sport: str | None = None
+        self,
+        container,
+        date: datetime,
+        section_sport: str | None = None,
+        text: str | None = None,
     ) -> SportEvent | None:
         """Parse a single event container."""
         try:
-            text = container.get_text(separator=" ", strip=True)
+            if text is None:
+                text = self._element_text(container)
+            # Lowercased once and shared by the extractors below
+            text_lower = text.lower()
 
             # Extract time
-            time_match = re.search(r"\b(\d{1,2})[.:](\d{2})\b", text)
+            time_match = _TIME_RE.search(text)
             if not time_match:
                 return None
 
@@ -145,10 +298,10 @@ class TVSportenProvider(SportProvider):
             if not (0 <= hour <= 23 and 0 <= minute <= 59):
                 return None
 
-            start_time = date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            start_time, start_iso = self._start_slot(date, hour, minute)
 
             # Extract channel
-            channel = self._extract_channel(container, text)
+            channel = self._extract_channel(container, text_lower)
 
             # Extract title/match info
             title = self._extract_title(container, text, time_match.group(0))
@@ -166,14 +319,14 @@ class TVSportenProvider(SportProvider):
             sport = section_sport or self._get_element_sport(container) or self._detect_sport(text)
 
             # Extract league if present
-            league = self._extract_league(container, text)
+            league = self._extract_league(container, text_lower)
 
             # Check if live
-            is_live = self._check_if_live(container, text)
+            is_live = self._check_if_live(container, text_lower)
 
             event_id = self._generate_id(
                 self.name,
-                start_time.isoformat(),
+                start_iso,
                 title,
                 channel,
             )
@@ -201,22 +354,19 @@ class TVSportenProvider(SportProvider):
         classes = element.get("class", [])
         if classes:
             class_str = " ".join(classes)
-            detected = self._detect_sport(class_str)
+            detected = self._detect_label_sport(class_str)
             if detected != "other":
                 return detected
 
         # Check data attributes
         for attr in ["data-sport", "data-category", "data-type"]:
             if element.get(attr):
-                detected = self._detect_sport(element.get(attr))
+                detected = self._detect_label_sport(element.get(attr))
                 if detected != "other":
                     return detected
 
         # Check for sport-specific child element
-        sport_elem = element.select_one(
-            ".sport, .category, .sport-type, "
-            "[class*='sport-'], [class*='category-']"
-        )
+        sport_elem = _SPORT_ELEM_SEL.select_one(element)
         if sport_elem:
             detected = self._detect_sport(sport_elem.get_text(strip=True))
             if detected != "other":
@@ -224,40 +374,19 @@ class TVSportenProvider(SportProvider):
 
         return None
 
-    def _extract_channel(self, container, text: str) -> str | None:
+    def _extract_channel(self, container, text_lower: str) -> str | None:
         """Extract TV channel from container."""
-        # Common Swedish sport channels
-        channels = [
-            "TV4", "TV4+", "TV4 Sport", "TV4 Fakta",
-            "SVT1", "SVT2", "SVT24", "SVT",
-            "Kanal 5", "Kanal 9", "Kanal 11",
-            "Eurosport 1", "Eurosport 2", "Eurosport",
-            "Viasat Sport", "Viasat Hockey", "Viasat Fotboll",
-            "Viasat Golf", "Viasat Motor", "Viasat",
-            "V Sport 1", "V Sport 2", "V Sport Premium", "V Sport",
-            "C More Live", "C More Fotboll", "C More Hockey", "C More Sport", "C More",
-            "Sportkanalen",
-            "Telia", "TV3", "TV3+", "TV6", "TV8", "TV10",
-            "Discovery+", "Discovery", "Max",
-            "Dplay", "Viafree", "TV4 Play", "SVT Play",
-        ]
-
-        text_lower = text.lower()
-
         # Try to find channel in specific elements first
-        channel_elem = container.select_one(
-            ".channel, .tv-channel, .broadcaster, .kanal, "
-            "[class*='channel'], [class*='kanal']"
-        )
+        channel_elem = _CHANNEL_SEL.select_one(container)
         if channel_elem:
-            channel_text = channel_elem.get_text(strip=True)
-            for ch in channels:
-                if ch.lower() in channel_text.lower():
-                    return ch
+            channel_text = channel_elem.get_text(strip=True).lower()
+            for channel_lower, channel in _CHANNELS_LOWER:
+                if channel_lower in channel_text:
+                    return channel
 
         # Search in full text
-        for channel in channels:
-            if channel.lower() in text_lower:
+        for channel_lower, channel in _CHANNELS_LOWER:
+            if channel_lower in text_lower:
                 return channel
 
         return None
@@ -265,10 +394,7 @@ class TVSportenProvider(SportProvider):
     def _extract_title(self, container, text: str, time_str: str) -> str | None:
         """Extract event title."""
         # Try to find title in specific elements
-        title_elem = container.select_one(
-            ".title, .event-title, .match-title, .teams, "
-            "h2, h3, h4, .name, [class*='title'], [class*='match']"
-        )
+        title_elem = _TITLE_SEL.select_one(container)
         if title_elem:
             title = title_elem.get_text(strip=True)
             if len(title) > 3:
@@ -276,15 +402,10 @@ class TVSportenProvider(SportProvider):
 
         # Fall back to cleaning up the full text
         # Remove time from beginning
-        title = re.sub(r"^\s*\d{1,2}[.:]\d{2}\s*", "", text)
+        title = _TIME_PREFIX_RE.sub("", text)
 
         # Remove common channel names at the end
-        title = re.sub(
-            r"\s*(TV4|SVT\d?|Eurosport\s*\d?|Viasat|V Sport|C More|Kanal \d+).*$",
-            "",
-            title,
-            flags=re.IGNORECASE,
-        )
+        title = _CHANNEL_TAIL_RE.sub("", title)
 
         # Clean up
         title = " ".join(title.split())
@@ -303,58 +424,16 @@ class TVSportenProvider(SportProvider):
 
         return title.strip() if title.strip() else None
 
-    def _extract_league(self, container, text: str) -> str | None:
+    def _extract_league(self, container, text_lower: str) -> str | None:
         """Extract league/competition name."""
-        league_elem = container.select_one(
-            ".league, .competition, .tournament, .liga, "
-            "[class*='league'], [class*='competition']"
-        )
+        league_elem = _LEAGUE_SEL.select_one(container)
         if league_elem:
             league_text = league_elem.get_text(strip=True)
             # Don't return generic terms that might be misdetected
-            if league_text and league_text.lower() not in ["os", "vm", "em"]:
+            if league_text and league_text.lower() not in _GENERIC_LEAGUE_TERMS:
                 return league_text
 
-        text_lower = text.lower()
-
-        # Specific league patterns (longer/more specific first)
-        specific_leagues = [
-            ("champions league", "Champions League"),
-            ("europa league", "Europa League"),
-            ("conference league", "Conference League"),
-            ("premier league", "Premier League"),
-            ("premier padel", "Premier Padel Tour"),
-            ("la liga", "La Liga"),
-            ("serie a", "Serie A"),
-            ("bundesliga", "Bundesliga"),
-            ("ligue 1", "Ligue 1"),
-            ("eredivisie", "Eredivisie"),
-            ("allsvenskan", "Allsvenskan"),
-            ("superettan", "Superettan"),
-            ("hockeyallsvenskan", "Hockeyallsvenskan"),
-            ("shl", "SHL"),
-            ("nhl", "NHL"),
-            ("nba", "NBA"),
-            ("nfl", "NFL"),
-            ("mlb", "MLB"),
-            ("atp", "ATP"),
-            ("wta", "WTA"),
-            ("world cup", "World Cup"),
-            ("världscupen", "Världscupen"),
-            ("shoot out", "Shoot Out"),
-            # Sport-specific VM/EM (only match when sport context is clear)
-            ("handboll-vm", "Handbolls-VM"),
-            ("handbolls-vm", "Handbolls-VM"),
-            ("handboll-em", "Handbolls-EM"),
-            ("handbolls-em", "Handbolls-EM"),
-            ("fotbolls-vm", "Fotbolls-VM"),
-            ("fotbolls-em", "Fotbolls-EM"),
-            ("ishockey-vm", "Ishockey-VM"),
-            ("hockey-vm", "Hockey-VM"),
-            ("dart-vm", "Dart-VM"),
-        ]
-
-        for pattern, name in specific_leagues:
+        for pattern, name in _SPECIFIC_LEAGUES:
             if pattern in text_lower:
                 return name
 
@@ -362,17 +441,14 @@ class TVSportenProvider(SportProvider):
         # Let them remain as None and the sport detection handle the context
         return None
 
-    def _check_if_live(self, container, text: str) -> bool:
+    def _check_if_live(self, container, text_lower: str) -> bool:
         """Check if event is currently live."""
-        live_indicators = ["live", "direktsändning", "pågår", "nu"]
-        text_lower = text.lower()
-
-        for indicator in live_indicators:
+        for indicator in _LIVE_INDICATORS:
             if indicator in text_lower:
                 return True
 
         # Check for live class/attribute
-        if container.select_one(".live, .is-live, [class*='live']"):
+        if _LIVE_SEL.select_one(container):
             return True
 
         return False
@@ -120,6 +120,7 @@ class SportSyncFavoritesSensor(SportSyncBaseSensor):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_favorites"
         self._load_favorites()
+        self._update_favorite_events()
 
     def _load_favorites(self) -> None:
         """Load favorites from config entry options."""
@@ -129,32 +130,30 @@ class SportSyncFavoritesSensor(SportSyncBaseSensor):
         self._favorite_titles = self._entry.options.get(CONF_FAVORITE_TITLES, [])
         self._favorite_channels = self._entry.options.get(CONF_FAVORITE_CHANNELS, [])
 
+    def _update_favorite_events(self) -> None:
+        """Match events against favorites once per coordinator update."""
+        self._favorite_events: list[dict[str, Any]] = (
+            self.data.get_favorites() if self.data else []
+        )
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from coordinator."""
-        self._load_favorites()
+        # Favorites come from the entry options, and changing those reloads
+        # the entry, so they only need loading once in __init__
+        self._update_favorite_events()
         super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> int:
         """Return number of favorite events."""
-        if self.data:
-            return len(
-                self.data.get_favorites(
-                    self._favorite_sports,
-                    self._favorite_teams,
-                    self._favorite_leagues,
-                    self._favorite_titles,
-                    self._favorite_channels,
-                )
-            )
-        return 0
+        return len(self._favorite_events)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return state attributes."""
         attrs: dict[str, Any] = {
-            "events": [],
+            "events": self._favorite_events,
             "favorite_sports": self._favorite_sports,
             "favorite_teams": self._favorite_teams,
             "favorite_leagues": self._favorite_leagues,
@@ -162,15 +161,6 @@ class SportSyncFavoritesSensor(SportSyncBaseSensor):
             "favorite_channels": self._favorite_channels,
         }
 
-        if self.data:
-            attrs["events"] = self.data.get_favorites(
-                self._favorite_sports,
-                self._favorite_teams,
-                self._favorite_leagues,
-                self._favorite_titles,
-                self._favorite_channels,
-            )
-
         return attrs
 
 